@@ -11,142 +11,216 @@ Matching rules (each INSPIRE ref matched at most once, by priority):
 """
 
 import json
+import multiprocessing
+import os
 import re
+import string
 import sys
-
-
+from collections import Counter, defaultdict
+from functools import lru_cache
+
+try:
+    # ~3-5x faster than stdlib json on multi-MB INSPIRE metadata files
+    import orjson
+
+    def _load_json(f):
+        return orjson.loads(f.read())
+except ImportError:
+    def _load_json(f):
+        return json.load(f)
+
+try:
+    # Streaming parser: lets load_inspire_refs walk the references array
+    # without materializing the rest of the (often multi-MB) metadata
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Known equivalent abbreviations, substituted in a single pass over the
+# normalized title. Longest-first alternation so e.g. "statistik" wins over
+# "statist" and "japan" over "jap" at the same position.
+_ABBREV = {
+    "rept": "rep",
+    "annu": "ann",
+    "quantum": "quant",
+    "gravity": "grav",
+    "methods": "meth",
+    "annals": "ann",
+    "polon": "pol",
+    "atom": "at",
+    "nuovo": "nuov",
+    "cimento": "cim",
+    "relativ": "rel",
+    "astron": "astr",
+    # "europhysics" needs its own entry: the old sequential replace chain got
+    # it in two steps ("europhys" then "physics"), which a single pass cannot
+    "europhysics": "eurphys",
+    "europhys": "eurphys",
+    "royal": "r",
+    "roy": "r",
+    "spectop": "st",
+    "fortschr": "fortsch",
+    "london": "lond",
+    "scripta": "scr",
+    "japan": "jpn",
+    "jap": "jpn",
+    "czechoslov": "czech",
+    "materials": "mater",
+    "concepts": "",
+    "photonics": "photon",
+    "uspekhi": "usp",
+    "statistik": "stat",
+    "statist": "stat",
+    "natl": "nat",
+    "national": "nat",
+    "frontiers": "front",
+    "philos": "phil",
+    "theory": "theor",
+    "interiors": "inter",
+    "molec": "mol",
+    "cambridge": "camb",
+    "nuclear": "nucl",
+    "physics": "phys",
+}
+_ABBREV_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_ABBREV, key=len, reverse=True))
+)
+_NONALNUM_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
+# Trailing suffixes stripped from normalized titles
+_TRAILING_LOC = ("usa", "uk")
+_TRAILING_SER = ("series", "ser")
+
+
+def _abbrev_sub(m, _get=_ABBREV.__getitem__):
+    # Module-level with the table getter pre-bound: no closure allocation per
+    # normalize_journal call, no attribute lookups per match
+    return _get(m.group(0))
+
+# Map full journal forms to INSPIRE short forms
+_EQUIV = {
+    "jhighenergyphys": "jhep",
+    "jcosmolastropartphys": "jcap",
+    "nuclinstrummethphysres": "nuclinstrummeth",
+    "eurphyslett": "epl",
+    "natmater": "naturemater",
+    "natphys": "naturephys",
+    "nuovcimlett": "lettnuovcim",
+    "nuovcimriv": "rivnuovcim",
+    "annphysleipzig": "annphys",
+    "annphysnewyork": "annphys",
+    "highenergyphysnuclphys": "hepnp",
+    "highenergyphysnuclphysbeijing": "hepnp",
+    "ieeetransinftheor": "ieeetransinfotheor",
+    # Soviet/Russian → modern journal equivalences
+    "sovphysjetp": "jexptheorphys",
+    "sovphysusp": "physusp",
+    "yadfiz": "physatnucl",
+    "sovjnuclphys": "physatnucl",
+    "zhekspteorfiz": "jexptheorphys",
+    # Full name → abbreviation
+    "progtheorexpphys": "ptep",
+    "procspieintsocopteng": "procspie",
+    # Minor abbreviation differences
+    "jdiffergeom": "jdiffgeom",
+    "jmolecspectrosc": "jmolspectrosc",
+    "pramanajphys": "pramana",
+    "hadronicj": "hadronj",
+    # Strip "direct" from Eur.Phys.J.direct (online-only = same as EPJ)
+    "eurphysjdirect": "eurphysj",
+    # Phys.Scripta Topical Issues → Phys.Scripta
+    "physscrtopissues": "physscrt",
+    # Naturwissenschaften full name → abbreviation
+    "naturwissenschaften": "naturwiss",
+    # Fortschritte der Physik → Fortsch.Phys.
+    "fortschittederphys": "fortschphys",
+    # Annalen der Physik (Berlin) ←→ Ann. Phys. (used interchangeably in citations)
+    "annalenphys": "annphys",
+    # Comptes Rendus Physique full name → abbreviation
+    "comptesrendusphysique": "crphys",
+    # Chinese Physics C / Chinese Journal of Physics C (same journal, renamed)
+    "chinjphysc": "chinphysc",
+    # Grav. Cosmol. abbreviation variants
+    "gravitcosmol": "gravcosmol",
+    # Eur. Phys. J. truncated to Phys. J. (line break in PDF)
+    "physjc": "eurphysjc",
+    "physja": "eurphysja",
+    # Nature sub-journals: "Nat." ↔ "Nature" prefix interchangeable
+    "natphoton": "naturephoton",
+    "natnanotech": "naturenanotech",
+    "natcommun": "naturecommun",
+    "natelectron": "natureelectron",
+    "natrevphys": "naturerevphys",
+    "natastr": "natureastr",
+    "natchem": "naturechem",
+}
+# Bucketed by first character (order within a bucket preserved) so
+# normalize_journal only scans the handful of prefixes that could apply
+_EQUIV_BY_FIRST: dict[str, list[tuple[str, str]]] = defaultdict(list)
+for _full, _short in _EQUIV.items():
+    _EQUIV_BY_FIRST[_full[0]].append((_full, _short))
+
+
+@lru_cache(maxsize=8192)
 def normalize_arxiv(aid: str) -> str:
     """Normalize arXiv ID: lowercase, strip version suffix."""
     if not aid:
         return ""
     aid = aid.strip().lower()
-    # Remove version: 1234.5678v2 -> 1234.5678
-    aid = re.sub(r"v\d+$", "", aid)
-    return aid
+    # Remove version: 1234.5678v2 -> 1234.5678 (always 'v' + digits at the end,
+    # so a plain suffix check beats the regex engine)
+    i = aid.rfind("v")
+    if i > 0 and aid[i + 1:].isdigit():
+        aid = aid[:i]
+    # Interned: the same IDs recur across refs, and interning makes set/dict
+    # probes an identity check while sharing the storage
+    return sys.intern(aid)
 
 
+@lru_cache(maxsize=8192)
 def normalize_doi(doi: str) -> str:
     if not doi:
         return ""
-    return doi.strip().lower()
+    return sys.intern(doi.strip().lower())
 
 
+@lru_cache(maxsize=8192)
 def normalize_journal(title: str) -> str:
     """Normalize journal title for comparison: strip non-alpha, lowercase."""
     if not title:
         return ""
-    n = re.sub(r"[^a-zA-Z0-9]+", "", title).lower()
-    # Known equivalent abbreviations
-    n = n.replace("rept", "rep")
-    n = n.replace("annu", "ann")
-    n = n.replace("quantum", "quant")
-    n = n.replace("gravity", "grav")
-    n = n.replace("methods", "meth")
-    n = n.replace("annals", "ann")
-    n = n.replace("polon", "pol")
-    n = n.replace("atom", "at")
-    n = n.replace("nuovo", "nuov")
-    n = n.replace("cimento", "cim")
-    n = n.replace("relativ", "rel")
-    n = n.replace("astron", "astr")
-    n = n.replace("europhys", "eurphys")
-    n = n.replace("royal", "r")
-    n = n.replace("roy", "r")
-    n = n.replace("spectop", "st")
-    n = n.replace("fortschr", "fortsch")
-    n = n.replace("london", "lond")
-    n = n.replace("scripta", "scr")
-    n = n.replace("japan", "jpn")
-    n = n.replace("jap", "jpn")
-    n = n.replace("czechoslov", "czech")
-    n = n.replace("materials", "mater")
-    n = n.replace("concepts", "")
-    n = n.replace("photonics", "photon")
-    n = n.replace("uspekhi", "usp")
-    n = n.replace("statistik", "stat")
-    n = n.replace("statist", "stat")
-    n = n.replace("natl", "nat")
-    n = n.replace("national", "nat")
-    n = n.replace("frontiers", "front")
-    n = n.replace("philos", "phil")
-    n = n.replace("theory", "theor")
-    n = n.replace("interiors", "inter")
-    n = n.replace("molec", "mol")
-    n = n.replace("cambridge", "camb")
-    n = n.replace("nuclear", "nucl")
-    n = n.replace("physics", "phys")
+    n = _NONALNUM_RE.sub("", title).lower()
+    # Known equivalent abbreviations, all in one scan
+    n = _ABBREV_RE.sub(_abbrev_sub, n)
     # Strip trailing location/country suffixes
-    for suffix in ("usa", "uk"):
+    for suffix in _TRAILING_LOC:
         if n.endswith(suffix):
             n = n[:-len(suffix)]
             break
     # Strip trailing "ser" / "series" (supplement series)
-    for suffix in ("series", "ser"):
+    for suffix in _TRAILING_SER:
         if n.endswith(suffix):
             n = n[:-len(suffix)]
             break
     # Map full forms to INSPIRE short forms
-    equiv = {
-        "jhighenergyphys": "jhep",
-        "jcosmolastropartphys": "jcap",
-        "nuclinstrummethphysres": "nuclinstrummeth",
-        "eurphyslett": "epl",
-        "natmater": "naturemater",
-        "natphys": "naturephys",
-        "nuovcimlett": "lettnuovcim",
-        "nuovcimriv": "rivnuovcim",
-        "annphysleipzig": "annphys",
-        "annphysnewyork": "annphys",
-        "highenergyphysnuclphys": "hepnp",
-        "highenergyphysnuclphysbeijing": "hepnp",
-        "ieeetransinftheor": "ieeetransinfotheor",
-        # Soviet/Russian → modern journal equivalences
-        "sovphysjetp": "jexptheorphys",
-        "sovphysusp": "physusp",
-        "yadfiz": "physatnucl",
-        "sovjnuclphys": "physatnucl",
-        "zhekspteorfiz": "jexptheorphys",
-        # Full name → abbreviation
-        "progtheorexpphys": "ptep",
-        "procspieintsocopteng": "procspie",
-        # Minor abbreviation differences
-        "jdiffergeom": "jdiffgeom",
-        "jmolecspectrosc": "jmolspectrosc",
-        "pramanajphys": "pramana",
-        "hadronicj": "hadronj",
-        # Strip "direct" from Eur.Phys.J.direct (online-only = same as EPJ)
-        "eurphysjdirect": "eurphysj",
-        # Phys.Scripta Topical Issues → Phys.Scripta
-        "physscrtopissues": "physscrt",
-        # Naturwissenschaften full name → abbreviation
-        "naturwissenschaften": "naturwiss",
-        # Fortschritte der Physik → Fortsch.Phys.
-        "fortschittederphys": "fortschphys",
-        # Annalen der Physik (Berlin) ←→ Ann. Phys. (used interchangeably in citations)
-        "annalenphys": "annphys",
-        # Comptes Rendus Physique full name → abbreviation
-        "comptesrendusphysique": "crphys",
-        # Chinese Physics C / Chinese Journal of Physics C (same journal, renamed)
-        "chinjphysc": "chinphysc",
-        # Grav. Cosmol. abbreviation variants
-        "gravitcosmol": "gravcosmol",
-        # Eur. Phys. J. truncated to Phys. J. (line break in PDF)
-        "physjc": "eurphysjc",
-        "physja": "eurphysja",
-        # Nature sub-journals: "Nat." ↔ "Nature" prefix interchangeable
-        "natphoton": "naturephoton",
-        "natnanotech": "naturenanotech",
-        "natcommun": "naturecommun",
-        "natelectron": "natureelectron",
-        "natrevphys": "naturerevphys",
-        "natastr": "natureastr",
-        "natchem": "naturechem",
-    }
-    for full, short in equiv.items():
+    for full, short in _EQUIV_BY_FIRST.get(n[:1], ()):
         if n.startswith(full):
             n = short + n[len(full):]
             break
-    return n
+    return sys.intern(n)
+
+
+_VOL_SEP_RE = re.compile("[-–—]")
+_ASCII_LETTERS = string.ascii_letters
+
+
+@lru_cache(maxsize=4096)
+def _vol_parts(v: str) -> tuple[str, ...]:
+    """Split a volume on dash separators, cached: the same volume string gets
+    compared against many candidates."""
+    return tuple(_VOL_SEP_RE.split(v))
 
 
 def volumes_match(v1: str, v2: str, journal: str = "") -> bool:
@@ -160,6 +234,17 @@ def volumes_match(v1: str, v2: str, journal: str = "") -> bool:
     if v1 == v2:
         return True
 
+    # Cheap reject: every accepting rule below either keeps the lengths
+    # within 4 of each other (year prefixes, journal-specific encodings),
+    # requires one volume to contain the other (combined volumes, alpha
+    # prefixes), or works on the zero-stripped forms with a diff of at most
+    # 2. Anything else can't match.
+    if abs(len(v1) - len(v2)) > 4 and v1 not in v2 and v2 not in v1:
+        s1 = v1.lstrip("0") or "0"
+        s2 = v2.lstrip("0") or "0"
+        if abs(len(s1) - len(s2)) > 2 and s1 not in s2 and s2 not in s1:
+            return False
+
     # Journal-specific rules
     # jstatmech: INSPIRE stores month-only volumes like '07', '04'.
     # Extracted articles are like '01015', '03001' (5 digits, chars [0:2] = month).
@@ -193,15 +278,8 @@ def volumes_match(v1: str, v2: str, journal: str = "") -> bool:
     if len(short) >= 2 and long.endswith(short) and len(long) - len(short) <= 2:
         return True
     # Combined volume: "904-905" matches "904" or "905"
-    for sep in ("-", "–", "—"):
-        if sep in v1:
-            parts = v1.split(sep)
-            if v2 in parts:
-                return True
-        if sep in v2:
-            parts = v2.split(sep)
-            if v1 in parts:
-                return True
+    if v2 in _vol_parts(v1) or v1 in _vol_parts(v2):
+        return True
     # Leading-zero normalization: "04" matches "4" (JCAP/JHEP volumes)
     s1 = v1.lstrip("0") or "0"
     s2 = v2.lstrip("0") or "0"
@@ -213,7 +291,7 @@ def volumes_match(v1: str, v2: str, journal: str = "") -> bool:
         return True
     # Alpha-prefixed volume: "LAT2006" matches "2006" (PoS conference codes)
     if short.isdigit() and not long.isdigit():
-        alpha_stripped = long.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+        alpha_stripped = long.lstrip(_ASCII_LETTERS)
         if alpha_stripped == short:
             return True
     return False
@@ -254,69 +332,115 @@ def journals_match(j1: str, j2: str) -> bool:
     return False
 
 
-def load_inspire_refs(meta_path: str) -> list[dict]:
-    """Extract reference identifiers from INSPIRE metadata."""
+# Reference record: (arxiv, doi, journal, volume). A plain tuple rather than a
+# dict — records are fixed-shape, and hashable tuples let match_refs dedup
+# identical entries and build set/dict indices directly.
+Ref = tuple[str, str, str, str]
+
+
+def _iter_inspire_references(meta_path: str):
+    """Yield raw reference entries from an INSPIRE metadata file.
+
+    Streams one reference at a time via ijson when available — the ~99% of
+    the payload we never look at (authors, abstracts, ...) is then never
+    built — and falls back to parsing the whole document otherwise.
+    """
+    if ijson is not None:
+        with open(meta_path, "rb") as f:
+            yield from ijson.items(f, "metadata.references.item")
+        return
     with open(meta_path) as f:
-        data = json.load(f)
+        data = _load_json(f)
+    yield from data.get("metadata", {}).get("references", [])
+
+
+def _field_value(item) -> str:
+    """INSPIRE list fields hold either plain strings or {"value": ...} dicts."""
+    return item.get("value", item) if isinstance(item, dict) else item
 
+
+def load_inspire_refs(meta_path: str) -> list[Ref]:
+    """Extract reference identifiers from INSPIRE metadata."""
     refs = []
-    for entry in data.get("metadata", {}).get("references", []):
+    refs_append = refs.append  # bound once; the loop runs per reference
+    for entry in _iter_inspire_references(meta_path):
         ref = entry.get("reference", {})
         pub = ref.get("publication_info", {})
-
-        dois = ref.get("dois") or []
-        doi_val = ""
-        if dois:
-            first = dois[0]
-            doi_val = first.get("value", first) if isinstance(first, dict) else first
-
-        refs.append({
-            "arxiv": normalize_arxiv(ref.get("arxiv_eprint", "")),
-            "doi": normalize_doi(doi_val),
-            "journal": normalize_journal(pub.get("journal_title", "")),
-            "volume": (pub.get("journal_volume") or "").strip(),
-        })
+        dois = ref.get("dois")
+
+        refs_append((
+            normalize_arxiv(ref.get("arxiv_eprint", "")),
+            normalize_doi(_field_value(dois[0]) if dois else ""),
+            normalize_journal(pub.get("journal_title", "")),
+            (pub.get("journal_volume") or "").strip(),
+        ))
     return refs
 
 
-def load_extracted_refs(result_path: str) -> list[dict]:
+def load_extracted_refs(result_path: str) -> list[Ref]:
     """Load refextract JSON output."""
     with open(result_path) as f:
-        data = json.load(f)
+        data = _load_json(f)
 
     # Handle both array and single-object output
     if isinstance(data, dict):
         data = [data]
 
     refs = []
+    refs_append = refs.append
     for entry in data:
-        refs.append({
-            "arxiv": normalize_arxiv(entry.get("arxiv_id", "")),
-            "doi": normalize_doi(entry.get("doi", "")),
-            "journal": normalize_journal(entry.get("journal_title", "")),
-            "volume": (entry.get("journal_volume") or "").strip(),
-        })
+        refs_append((
+            normalize_arxiv(entry.get("arxiv_id", "")),
+            normalize_doi(entry.get("doi", "")),
+            normalize_journal(entry.get("journal_title", "")),
+            (entry.get("journal_volume") or "").strip(),
+        ))
     return refs
 
 
-def match_refs(inspire_refs: list[dict], extracted_refs: list[dict]) -> tuple[int, int, int]:
+def _vols_hit(candidates, iv: str, iv_z: str, ij: str) -> bool:
+    """True if any (volume, zero-stripped) candidate matches the INSPIRE volume."""
+    return any(
+        ev == iv or ev_z == iv_z or volumes_match(ev, iv, ij)
+        for ev, ev_z in candidates
+    )
+
+
+def _find_journal_match(ij, iv, ext_jv_set, by_journal, by_prefix) -> bool:
+    """Probe the extracted-side indices for a journal+volume match.
+
+    Cheapest first: exact pair, exact journal with fuzzy volume, then fuzzy
+    journal over the 6-char-prefix bucket.
+    """
+    if (ij, iv) in ext_jv_set:
+        return True
+    iv_z = iv.lstrip("0") or "0"
+    if _vols_hit(by_journal.get(ij, ()), iv, iv_z, ij):
+        return True
+    return any(
+        ej != ij and journals_match(ij, ej) and _vols_hit(by_journal[ej], iv, iv_z, ij)
+        for ej in by_prefix.get(ij[:6], ())
+    )
+
+
+def match_refs(inspire_refs: list[Ref], extracted_refs: list[Ref]) -> tuple[int, int, int]:
     """Match extracted refs against INSPIRE ground truth.
 
     Returns (matched_arxiv, matched_journal, matched_doi).
     Each INSPIRE ref is matched at most once, by priority: arxiv > doi > journal.
     """
-    matched_arxiv = 0
-    matched_journal = 0
-    matched_doi = 0
-
     # Build lookup sets from extracted refs
-    ext_arxiv = {r["arxiv"] for r in extracted_refs if r["arxiv"]}
-    ext_doi = {r["doi"] for r in extracted_refs if r["doi"]}
+    ext_arxiv = {arxiv for arxiv, _, _, _ in extracted_refs if arxiv}
+    ext_doi = {doi for _, doi, _, _ in extracted_refs if doi}
     ext_jv = [
-        (r["journal"], r["volume"])
-        for r in extracted_refs
-        if r["journal"] and r["volume"]
+        (journal, volume)
+        for _, _, journal, volume in extracted_refs
+        if journal and volume
     ]
+    # Nothing extracted worth probing (e.g. extraction failure): skip the
+    # whole INSPIRE walk.
+    if not (ext_arxiv or ext_doi or ext_jv):
+        return 0, 0, 0
     # PoS normalization: "poslat" vol="2005" → also try "pos" vol="LAT2005"
     pos_extra = []
     for ej, ev in ext_jv:
@@ -325,33 +449,102 @@ def match_refs(inspire_refs: list[dict], extracted_refs: list[dict]) -> tuple[in
             pos_extra.append(("pos", suffix + ev))
     ext_jv.extend(pos_extra)
 
-    for iref in inspire_refs:
-        # Try arXiv match first
-        if iref["arxiv"] and iref["arxiv"] in ext_arxiv:
-            matched_arxiv += 1
-            continue
+    # Index journal+volume pairs so each INSPIRE ref probes a handful of
+    # candidates instead of scanning the full list (quadratic on big papers).
+    # Exact journal name first (the common case), then a 6-char-prefix probe:
+    # every fuzzy rule in journals_match needs either equality or a shared
+    # >= 6-char prefix, so candidates outside the prefix range can never match.
+    # Volumes are stored with their zero-stripped key precomputed, so the two
+    # cheap accepting cases of volumes_match (exact and leading-zero equality)
+    # are a string compare instead of a full volumes_match call per probe.
+    # Exact (journal, volume) pairs: one hash probe resolves the common case
+    # where both sides are already well-normalized
+    ext_jv_set = set(ext_jv)
+    by_journal: dict[str, list[tuple[str, str]]] = defaultdict(list)
+    for ej, ev in ext_jv:
+        by_journal[ej].append((ev, ev.lstrip("0") or "0"))
+    # Bucket journal names by their first 6 chars for the fuzzy probe. Names
+    # shorter than 6 chars can only ever match exactly, which by_journal
+    # already covers, so they are left out of the buckets.
+    by_prefix: dict[str, list[str]] = defaultdict(list)
+    for ej in by_journal:
+        if len(ej) >= 6:
+            by_prefix[ej[:6]].append(ej)
+
+    # Identical INSPIRE records (duplicated entries are common in ground
+    # truth) are matched once and counted with their multiplicity. Matching
+    # runs as three priority passes (arxiv > doi > journal); the arXiv and DOI
+    # passes are plain set probes over unique records, done at C speed, and
+    # only the remainder reaches the Python-level journal logic.
+    recs = Counter(inspire_refs)
+    arxiv_hits = {rec for rec in recs if rec[0] and rec[0] in ext_arxiv}
+    matched_arxiv = sum(recs[rec] for rec in arxiv_hits)
+
+    doi_hits = {
+        rec for rec in recs.keys() - arxiv_hits if rec[1] and rec[1] in ext_doi
+    }
+    matched_doi = sum(recs[rec] for rec in doi_hits)
 
-        # Try DOI match
-        if iref["doi"] and iref["doi"] in ext_doi:
-            matched_doi += 1
-            continue
+    # Journal + volume match (flexible journal name matching) on the rest
+    matched_journal = 0
+    for rec in recs.keys() - arxiv_hits - doi_hits:
+        _, _, ij, iv = rec
+        if ij and iv and _find_journal_match(ij, iv, ext_jv_set, by_journal, by_prefix):
+            matched_journal += recs[rec]
 
-        # Try journal + volume match (flexible journal name matching)
-        if iref["journal"] and iref["volume"]:
-            for ej, ev in ext_jv:
-                if volumes_match(ev, iref["volume"], iref["journal"]) and journals_match(iref["journal"], ej):
-                    matched_journal += 1
-                    break
-            else:
-                continue
+    return matched_arxiv, matched_journal, matched_doi
+
+
+def _process_pair(paths: tuple[str, str]) -> tuple[str, int, int, int, int, int]:
+    result_path, meta_path = paths
+    inspire_refs = load_inspire_refs(meta_path)
+    extracted_refs = load_extracted_refs(result_path)
+    m_arxiv, m_journal, m_doi = match_refs(inspire_refs, extracted_refs)
+    stem = os.path.splitext(os.path.basename(result_path))[0]
+    return stem, len(inspire_refs), len(extracted_refs), m_arxiv, m_journal, m_doi
+
+
+def main_batch(manifest_path: str) -> None:
+    """Evaluate many (result, metadata) pairs in one process pool.
+
+    The manifest lists one "<result.json> <metadata.json>" pair per line
+    ("-" reads it from stdin). Prints one line per pair:
+        paper_id inspire_count extracted_count matched_arxiv matched_journal matched_doi
+
+    One invocation instead of one interpreter per paper, spread across cores.
+    """
+    if manifest_path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(manifest_path) as f:
+            lines = f.read().splitlines()
+    pairs = []
+    for line in lines:
+        fields = line.split()
+        if not fields:
             continue
+        if len(fields) != 2:
+            print(f"Bad manifest line: {line!r}", file=sys.stderr)
+            sys.exit(1)
+        pairs.append((fields[0], fields[1]))
 
-    return matched_arxiv, matched_journal, matched_doi
+    with multiprocessing.Pool() as pool:
+        # chunksize amortizes IPC; output order follows completion, so each
+        # row carries its paper id
+        for row in pool.imap_unordered(_process_pair, pairs, chunksize=8):
+            print(*row)
 
 
 def main():
+    if len(sys.argv) == 3 and sys.argv[1] == "--batch":
+        main_batch(sys.argv[2])
+        return
     if len(sys.argv) != 3:
-        print(f"Usage: {sys.argv[0]} <result.json> <metadata.json>", file=sys.stderr)
+        print(
+            f"Usage: {sys.argv[0]} <result.json> <metadata.json>\n"
+            f"       {sys.argv[0]} --batch <manifest|->",
+            file=sys.stderr,
+        )
         sys.exit(1)
 
     result_path = sys.argv[1]
@@ -14,145 +14,238 @@ import argparse
 import json
 import os
 import re
+import string
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+
+try:
+    # ~3-5x faster than stdlib json on multi-MB INSPIRE metadata files
+    import orjson
+
+    def _load_json(f):
+        return orjson.loads(f.read())
+except ImportError:
+    def _load_json(f):
+        return json.load(f)
+
+try:
+    # Streaming parser: pulls the references out of multi-MB metadata files
+    # without materializing the unused bulk of the document
+    import ijson
+except ImportError:
+    ijson = None
+
+# Below this size a whole-file parse beats ijson's per-event overhead
+_STREAM_THRESHOLD = 1_000_000
 
 
 # ---------------------------------------------------------------------------
 # Normalization helpers (identical to compare_refs.py)
 # ---------------------------------------------------------------------------
 
+# Known equivalent abbreviations, substituted in a single pass over the
+# normalized title. Longest-first alternation so e.g. "statistik" wins over
+# "statist" and "japan" over "jap" at the same position.
+_ABBREV = {
+    "rept": "rep",
+    "annu": "ann",
+    "quantum": "quant",
+    "gravity": "grav",
+    "methods": "meth",
+    "annals": "ann",
+    "polon": "pol",
+    "atom": "at",
+    "nuovo": "nuov",
+    "cimento": "cim",
+    "relativ": "rel",
+    "astron": "astr",
+    # "europhysics" needs its own entry: the old sequential replace chain got
+    # it in two steps ("europhys" then "physics"), which a single pass cannot
+    "europhysics": "eurphys",
+    "europhys": "eurphys",
+    "royal": "r",
+    "roy": "r",
+    "spectop": "st",
+    "fortschr": "fortsch",
+    "london": "lond",
+    "scripta": "scr",
+    "japan": "jpn",
+    "jap": "jpn",
+    "czechoslov": "czech",
+    "materials": "mater",
+    "concepts": "",
+    "photonics": "photon",
+    "uspekhi": "usp",
+    "statistik": "stat",
+    "statist": "stat",
+    "natl": "nat",
+    "national": "nat",
+    "frontiers": "front",
+    "philos": "phil",
+    "theory": "theor",
+    "interiors": "inter",
+    "molec": "mol",
+    "cambridge": "camb",
+    "nuclear": "nucl",
+    "physics": "phys",
+}
+_ABBREV_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_ABBREV, key=len, reverse=True))
+)
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+if ahocorasick is not None:
+    # One automaton scan finds every abbreviation occurrence; picking
+    # leftmost-longest non-overlapping hits reproduces the alternation above
+    _ABBREV_AUTO = ahocorasick.Automaton()
+    for _k, _v in _ABBREV.items():
+        _ABBREV_AUTO.add_word(_k, (len(_k), _v))
+    _ABBREV_AUTO.make_automaton()
+
+    def _abbrev_pass(n: str) -> str:
+        matches = sorted(
+            ((end - ln + 1, ln, repl) for end, (ln, repl) in _ABBREV_AUTO.iter(n)),
+            key=lambda m: (m[0], -m[1]),
+        )
+        out = []
+        pos = 0
+        for start, ln, repl in matches:
+            if start < pos:
+                continue
+            out.append(n[pos:start])
+            out.append(repl)
+            pos = start + ln
+        out.append(n[pos:])
+        return "".join(out)
+else:
+    def _abbrev_pass(n: str) -> str:
+        return _ABBREV_RE.sub(lambda m: _ABBREV[m.group(0)], n)
+
+# Map full journal forms to INSPIRE short forms
+_EQUIV = {
+    "jhighenergyphys": "jhep",
+    "jcosmolastropartphys": "jcap",
+    "nuclinstrummethphysres": "nuclinstrummeth",
+    "eurphyslett": "epl",
+    "natmater": "naturemater",
+    "natphys": "naturephys",
+    "nuovcimlett": "lettnuovcim",
+    "nuovcimriv": "rivnuovcim",
+    "annphysleipzig": "annphys",
+    "annphysnewyork": "annphys",
+    "highenergyphysnuclphys": "hepnp",
+    "highenergyphysnuclphysbeijing": "hepnp",
+    "ieeetransinftheor": "ieeetransinfotheor",
+    "sovphysjetp": "jexptheorphys",
+    "sovphysusp": "physusp",
+    "yadfiz": "physatnucl",
+    "sovjnuclphys": "physatnucl",
+    "zhekspteorfiz": "jexptheorphys",
+    "progtheorexpphys": "ptep",
+    "procspieintsocopteng": "procspie",
+    "jdiffergeom": "jdiffgeom",
+    "jmolecspectrosc": "jmolspectrosc",
+    "pramanajphys": "pramana",
+    "hadronicj": "hadronj",
+    "eurphysjdirect": "eurphysj",
+    "physscrtopissues": "physscrt",
+    "naturwissenschaften": "naturwiss",
+    "fortschittederphys": "fortschphys",
+    "annalenphys": "annphys",
+    "comptesrendusphysique": "crphys",
+    "chinjphysc": "chinphysc",
+    "gravitcosmol": "gravcosmol",
+    "physjc": "eurphysjc",
+    "physja": "eurphysja",
+    "natphoton": "naturephoton",
+    "natnanotech": "naturenanotech",
+    "natcommun": "naturecommun",
+    "natelectron": "natureelectron",
+    "natrevphys": "naturerevphys",
+    "natastr": "natureastr",
+    "natchem": "naturechem",
+}
+# Anchored prefix alternation; alternatives are tried in dict order, matching
+# the original first-startswith-wins scan
+_EQUIV_RE = re.compile("^(?:" + "|".join(re.escape(k) for k in _EQUIV) + ")")
+
+# Trailing suffixes, each stripped at most once and in this order
+_LOC_SUFFIX_RE = re.compile("(?:usa|uk)$")
+_SER_SUFFIX_RE = re.compile("(?:series|ser)$")
+
+_ARXIV_VER_RE = re.compile(r"v\d+$")
+_NONALNUM_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+_VOL_SEP_RE = re.compile("[-–—]")
+_ASCII_LETTERS = string.ascii_letters
+
+
+@lru_cache(maxsize=4096)
+def _vol_parts(v: str) -> tuple[str, ...]:
+    """Split a volume on dash separators, cached: the same volume string gets
+    compared against many candidates."""
+    return tuple(_VOL_SEP_RE.split(v))
+
+
+@lru_cache(maxsize=200_000)
 def normalize_arxiv(aid: str) -> str:
     """Normalize arXiv ID: lowercase, strip version suffix."""
     if not aid:
         return ""
     aid = aid.strip().lower()
-    aid = re.sub(r"v\d+$", "", aid)
+    aid = _ARXIV_VER_RE.sub("", aid)
     return aid
 
 
+@lru_cache(maxsize=200_000)
 def normalize_doi(doi: str) -> str:
     if not doi:
         return ""
     return doi.strip().lower()
 
 
+@lru_cache(maxsize=200_000)
 def normalize_journal(title: str) -> str:
     """Normalize journal title for comparison: strip non-alpha, lowercase."""
     if not title:
         return ""
-    n = re.sub(r"[^a-zA-Z0-9]+", "", title).lower()
-    n = n.replace("rept", "rep")
-    n = n.replace("annu", "ann")
-    n = n.replace("quantum", "quant")
-    n = n.replace("gravity", "grav")
-    n = n.replace("methods", "meth")
-    n = n.replace("annals", "ann")
-    n = n.replace("polon", "pol")
-    n = n.replace("atom", "at")
-    n = n.replace("nuovo", "nuov")
-    n = n.replace("cimento", "cim")
-    n = n.replace("relativ", "rel")
-    n = n.replace("astron", "astr")
-    n = n.replace("europhys", "eurphys")
-    n = n.replace("royal", "r")
-    n = n.replace("roy", "r")
-    n = n.replace("spectop", "st")
-    n = n.replace("fortschr", "fortsch")
-    n = n.replace("london", "lond")
-    n = n.replace("scripta", "scr")
-    n = n.replace("japan", "jpn")
-    n = n.replace("jap", "jpn")
-    n = n.replace("czechoslov", "czech")
-    n = n.replace("materials", "mater")
-    n = n.replace("concepts", "")
-    n = n.replace("photonics", "photon")
-    n = n.replace("uspekhi", "usp")
-    n = n.replace("statistik", "stat")
-    n = n.replace("statist", "stat")
-    n = n.replace("natl", "nat")
-    n = n.replace("national", "nat")
-    n = n.replace("frontiers", "front")
-    n = n.replace("philos", "phil")
-    n = n.replace("theory", "theor")
-    n = n.replace("interiors", "inter")
-    n = n.replace("molec", "mol")
-    n = n.replace("cambridge", "camb")
-    n = n.replace("nuclear", "nucl")
-    n = n.replace("physics", "phys")
-    for suffix in ("usa", "uk"):
-        if n.endswith(suffix):
-            n = n[: -len(suffix)]
-            break
-    for suffix in ("series", "ser"):
-        if n.endswith(suffix):
-            n = n[: -len(suffix)]
-            break
-    equiv = {
-        "jhighenergyphys": "jhep",
-        "jcosmolastropartphys": "jcap",
-        "nuclinstrummethphysres": "nuclinstrummeth",
-        "eurphyslett": "epl",
-        "natmater": "naturemater",
-        "natphys": "naturephys",
-        "nuovcimlett": "lettnuovcim",
-        "nuovcimriv": "rivnuovcim",
-        "annphysleipzig": "annphys",
-        "annphysnewyork": "annphys",
-        "highenergyphysnuclphys": "hepnp",
-        "highenergyphysnuclphysbeijing": "hepnp",
-        "ieeetransinftheor": "ieeetransinfotheor",
-        "sovphysjetp": "jexptheorphys",
-        "sovphysusp": "physusp",
-        "yadfiz": "physatnucl",
-        "sovjnuclphys": "physatnucl",
-        "zhekspteorfiz": "jexptheorphys",
-        "progtheorexpphys": "ptep",
-        "procspieintsocopteng": "procspie",
-        "jdiffergeom": "jdiffgeom",
-        "jmolecspectrosc": "jmolspectrosc",
-        "pramanajphys": "pramana",
-        "hadronicj": "hadronj",
-        "eurphysjdirect": "eurphysj",
-        "physscrtopissues": "physscrt",
-        "naturwissenschaften": "naturwiss",
-        "fortschittederphys": "fortschphys",
-        "annalenphys": "annphys",
-        "comptesrendusphysique": "crphys",
-        "chinjphysc": "chinphysc",
-        "gravitcosmol": "gravcosmol",
-        "physjc": "eurphysjc",
-        "physja": "eurphysja",
-        "natphoton": "naturephoton",
-        "natnanotech": "naturenanotech",
-        "natcommun": "naturecommun",
-        "natelectron": "natureelectron",
-        "natrevphys": "naturerevphys",
-        "natastr": "natureastr",
-        "natchem": "naturechem",
-    }
-    for full, short in equiv.items():
-        if n.startswith(full):
-            n = short + n[len(full):]
-            break
+    n = _NONALNUM_RE.sub("", title).lower()
+    # Known equivalent abbreviations, all in one scan
+    n = _abbrev_pass(n)
+    # Strip trailing location/country suffix, then "ser"/"series"
+    n = _LOC_SUFFIX_RE.sub("", n, count=1)
+    n = _SER_SUFFIX_RE.sub("", n, count=1)
+    # Map full forms to INSPIRE short forms
+    m = _EQUIV_RE.match(n)
+    if m:
+        n = _EQUIV[m.group(0)] + n[m.end():]
     return n
 
 
+@lru_cache(maxsize=1_000_000)
 def volumes_match(v1: str, v2: str) -> bool:
     if v1 == v2:
         return True
+    # Fast reject: every accepting rule below needs either a small length
+    # difference or one volume contained in the other (combined volumes,
+    # alpha/zero prefixes). Checked on the raw strings first, then on the
+    # zero-stripped forms ("85" vs "0000005" passes only the second).
+    if abs(len(v1) - len(v2)) > 4 and v1 not in v2 and v2 not in v1:
+        s1 = v1.lstrip("0") or "0"
+        s2 = v2.lstrip("0") or "0"
+        if abs(len(s1) - len(s2)) > 2 and s1 not in s2 and s2 not in s1:
+            return False
     short, long = (v1, v2) if len(v1) <= len(v2) else (v2, v1)
     if len(short) >= 2 and long.endswith(short) and len(long) - len(short) <= 2:
         return True
-    for sep in ("-", "\u2013", "\u2014"):
-        if sep in v1:
-            parts = v1.split(sep)
-            if v2 in parts:
-                return True
-        if sep in v2:
-            parts = v2.split(sep)
-            if v1 in parts:
-                return True
+    if v2 in _vol_parts(v1) or v1 in _vol_parts(v2):
+        return True
     s1 = v1.lstrip("0") or "0"
     s2 = v2.lstrip("0") or "0"
     if s1 == s2:
@@ -161,17 +254,22 @@ def volumes_match(v1: str, v2: str) -> bool:
     if len(short2) >= 1 and long2.endswith(short2) and len(long2) - len(short2) <= 2:
         return True
     if short.isdigit() and not long.isdigit():
-        alpha_stripped = long.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+        alpha_stripped = long.lstrip(_ASCII_LETTERS)
         if alpha_stripped == short:
             return True
     return False
 
 
+@lru_cache(maxsize=1_000_000)
 def journals_match(j1: str, j2: str) -> bool:
     if not j1 or not j2:
         return False
     if j1 == j2:
         return True
+    # Fast reject: the widest accepting rule is a section letter plus a
+    # "procsuppl" tail, a length difference of 10
+    if abs(len(j1) - len(j2)) > 10:
+        return False
     short, long = (j1, j2) if len(j1) <= len(j2) else (j2, j1)
     if long.startswith(short):
         diff = len(long) - len(short)
@@ -194,13 +292,21 @@ def journals_match(j1: str, j2: str) -> bool:
 # Data loading
 # ---------------------------------------------------------------------------
 
-def load_inspire_refs(meta_path: str) -> list[dict]:
-    """Load INSPIRE refs from metadata file, keeping raw fields for categorization."""
+def _iter_inspire_entries(meta_path: str):
+    """Yield reference entries from a metadata file, streaming large ones."""
+    if ijson is not None and os.path.getsize(meta_path) >= _STREAM_THRESHOLD:
+        with open(meta_path, "rb") as f:
+            yield from ijson.items(f, "metadata.references.item")
+        return
     with open(meta_path) as f:
-        data = json.load(f)
+        data = _load_json(f)
+    yield from data.get("metadata", {}).get("references", [])
+
 
+def load_inspire_refs(meta_path: str) -> list[dict]:
+    """Load INSPIRE refs from metadata file, keeping raw fields for categorization."""
     refs = []
-    for entry in data.get("metadata", {}).get("references", []):
+    for entry in _iter_inspire_entries(meta_path):
         ref = entry.get("reference", {})
         pub = ref.get("publication_info", {})
 
@@ -220,82 +326,119 @@ def load_inspire_refs(meta_path: str) -> list[dict]:
                     raw_text = val
                     break
 
+        journal = normalize_journal(pub.get("journal_title", ""))
         refs.append({
             "arxiv": normalize_arxiv(ref.get("arxiv_eprint", "")),
             "doi": normalize_doi(doi_val),
-            "journal": normalize_journal(pub.get("journal_title", "")),
+            "journal": journal,
+            # Hoisted once here for the candidate-bucket lookup in
+            # analyze_paper's hot loop
+            "journal_len": len(journal),
+            "journal_p6": journal[:6],
             "volume": (pub.get("journal_volume") or "").strip(),
             "raw_text": raw_text,
         })
     return refs
 
 
-def load_extracted_refs(result_path: str) -> list[dict]:
-    """Load refextract JSON output."""
+def load_extracted_refs(result_path: str) -> dict[str, list[str]]:
+    """Load refextract JSON output as parallel per-field lists.
+
+    The extracted side is only ever scanned field-by-field in the matching
+    loops, so a struct-of-arrays layout avoids a dict lookup per access.
+    """
     with open(result_path) as f:
-        data = json.load(f)
+        data = _load_json(f)
 
     if isinstance(data, dict):
         data = [data]
 
-    refs = []
+    arxiv: list[str] = []
+    doi: list[str] = []
+    journal: list[str] = []
+    volume: list[str] = []
+    raw_ref: list[str] = []
     for entry in data:
-        refs.append({
-            "arxiv": normalize_arxiv(entry.get("arxiv_id", "")),
-            "doi": normalize_doi(entry.get("doi", "")),
-            "journal": normalize_journal(entry.get("journal_title", "")),
-            "volume": (entry.get("journal_volume") or "").strip(),
-            "raw_ref": entry.get("raw_ref", ""),
-        })
-    return refs
+        arxiv.append(normalize_arxiv(entry.get("arxiv_id", "")))
+        doi.append(normalize_doi(entry.get("doi", "")))
+        journal.append(normalize_journal(entry.get("journal_title", "")))
+        volume.append((entry.get("journal_volume") or "").strip())
+        raw_ref.append(entry.get("raw_ref", ""))
+    return {
+        "arxiv": arxiv,
+        "doi": doi,
+        "journal": journal,
+        "volume": volume,
+        "raw_ref": raw_ref,
+    }
 
 
 # ---------------------------------------------------------------------------
 # Matching (identical logic to compare_refs.py)
 # ---------------------------------------------------------------------------
 
-def build_ext_lookups(extracted_refs: list[dict]) -> tuple[set, set, list]:
-    ext_arxiv = {r["arxiv"] for r in extracted_refs if r["arxiv"]}
-    ext_doi = {r["doi"] for r in extracted_refs if r["doi"]}
+def build_ext_lookups(
+    extracted: dict[str, list[str]],
+) -> tuple[set, set, dict, dict, set]:
+    ext_arxiv = set(extracted["arxiv"])
+    ext_arxiv.discard("")
+    ext_doi = set(extracted["doi"])
+    ext_doi.discard("")
     ext_jv = [
-        (r["journal"], r["volume"])
-        for r in extracted_refs
-        if r["journal"] and r["volume"]
+        (ej, ev)
+        for ej, ev in zip(extracted["journal"], extracted["volume"])
+        if ej and ev
     ]
-    # PoS normalization
+    # PoS normalization: extracted "posLATTICE2010" vol "254" corresponds to
+    # INSPIRE journal "pos" vol "LATTICE2010254". ext_pos holds the combined
+    # volumes for an O(1) exact probe; the pairs also go into jv_exact["pos"]
+    # so fuzzy volume matching still gets a shot when the probe misses.
+    ext_pos: set[str] = set()
     pos_extra = []
     for ej, ev in ext_jv:
         if ej.startswith("pos") and len(ej) > 3:
-            suffix = ej[3:].upper()
-            pos_extra.append(("pos", suffix + ev))
+            combined = ej[3:].upper() + ev
+            ext_pos.add(combined)
+            pos_extra.append(("pos", combined))
     ext_jv.extend(pos_extra)
-    return ext_arxiv, ext_doi, ext_jv
 
+    # Index the pairs so analyze_paper compares each INSPIRE ref against a
+    # small candidate bucket instead of the whole list. Every fuzzy rule in
+    # journals_match needs equality or a shared >= 6-char prefix, so journals
+    # outside the bucket can never match; names shorter than 6 chars can only
+    # match exactly and live in jv_exact alone.
+    jv_exact: dict[str, list[tuple[str, str]]] = defaultdict(list)
+    jv_prefix: dict[str, list[tuple[str, str]]] = defaultdict(list)
+    for ej, ev in ext_jv:
+        if len(ej) >= 6:
+            jv_prefix[ej[:6]].append((ej, ev))
+        else:
+            jv_exact[ej].append((ej, ev))
+    return ext_arxiv, ext_doi, jv_exact, jv_prefix, ext_pos
 
-def classify_unmatched(iref: dict) -> str:
-    """Categorize an unmatched INSPIRE ref."""
-    has_arxiv = bool(iref["arxiv"])
-    has_doi = bool(iref["doi"])
-    has_journal = bool(iref["journal"] and iref["volume"])
-    has_raw = bool(iref["raw_text"])
 
-    if not has_arxiv and not has_doi and not has_journal:
-        return "no_id"
-    if has_doi and not has_arxiv and not has_journal:
-        return "doi_only"
-    if has_journal:
-        return "journal_with_raw" if has_raw else "journal_no_raw"
-    # has_arxiv only (no journal, no doi)
-    return "arxiv_only"
+CATEGORIES = [
+    "no_id",
+    "doi_only",
+    "journal_no_raw",
+    "journal_with_raw",
+    "arxiv_only",
+    "zero_extract",
+]
+# Integer indices into CATEGORIES; hot loops store and count these and only
+# rebuild name-keyed dicts for display
+(_NO_ID, _DOI_ONLY, _JOURNAL_NO_RAW, _JOURNAL_WITH_RAW,
+ _ARXIV_ONLY, _ZERO_EXTRACT) = range(len(CATEGORIES))
 
 
 def analyze_paper(
     inspire_refs: list[dict],
-    extracted_refs: list[dict],
+    extracted: dict[str, list[str]],
 ) -> dict:
     """Match refs and return per-paper stats."""
-    zero_extract = len(extracted_refs) == 0
-    ext_arxiv, ext_doi, ext_jv = build_ext_lookups(extracted_refs)
+    n_ext = len(extracted["arxiv"])
+    zero_extract = n_ext == 0
+    ext_arxiv, ext_doi, jv_exact, jv_prefix, ext_pos = build_ext_lookups(extracted)
 
     matched_arxiv = 0
     matched_doi = 0
@@ -303,87 +446,105 @@ def analyze_paper(
     unmatched: list[dict] = []
 
     for iref in inspire_refs:
-        if iref["arxiv"] and iref["arxiv"] in ext_arxiv:
+        arxiv = iref["arxiv"]
+        if arxiv and arxiv in ext_arxiv:
             matched_arxiv += 1
             continue
 
-        if iref["doi"] and iref["doi"] in ext_doi:
+        doi = iref["doi"]
+        if doi and doi in ext_doi:
             matched_doi += 1
             continue
 
-        if iref["journal"] and iref["volume"]:
-            for ej, ev in ext_jv:
-                if volumes_match(ev, iref["volume"]) and journals_match(iref["journal"], ej):
+        ij = iref["journal"]
+        iv = iref["volume"]
+        has_journal = bool(ij and iv)
+        if has_journal:
+            if ij == "pos" and iv in ext_pos:
+                matched_journal += 1
+                continue
+            cands = (
+                jv_prefix.get(iref["journal_p6"], ())
+                if iref["journal_len"] >= 6
+                else jv_exact.get(ij, ())
+            )
+            matched = False
+            for ej, ev in cands:
+                if volumes_match(ev, iv) and journals_match(ij, ej):
                     matched_journal += 1
+                    matched = True
                     break
-            else:
-                if zero_extract:
-                    unmatched.append({**iref, "category": "zero_extract"})
-                else:
-                    unmatched.append({**iref, "category": classify_unmatched(iref)})
-            continue
+            if matched:
+                continue
 
+        # Classify inline from the fields already in hand (see CATEGORIES)
         if zero_extract:
-            unmatched.append({**iref, "category": "zero_extract"})
+            cat = _ZERO_EXTRACT
+        elif has_journal:
+            cat = _JOURNAL_WITH_RAW if iref["raw_text"] else _JOURNAL_NO_RAW
+        elif not arxiv and not doi:
+            cat = _NO_ID
+        elif doi and not arxiv:
+            cat = _DOI_ONLY
         else:
-            unmatched.append({**iref, "category": classify_unmatched(iref)})
+            cat = _ARXIV_ONLY
+        # The ref dicts are private to this run, so tag them in place rather
+        # than copying every field into a fresh dict
+        iref["category"] = cat
+        unmatched.append(iref)
 
     total_matched = matched_arxiv + matched_doi + matched_journal
     total_inspire = len(inspire_refs)
     recall = total_matched / total_inspire if total_inspire > 0 else 0.0
 
-    cats: dict[str, int] = defaultdict(int)
+    cats = [0] * len(CATEGORIES)
     for u in unmatched:
         cats[u["category"]] += 1
 
     return {
         "inspire_count": total_inspire,
-        "extracted_count": len(extracted_refs),
+        "extracted_count": n_ext,
         "matched": total_matched,
         "matched_arxiv": matched_arxiv,
         "matched_doi": matched_doi,
         "matched_journal": matched_journal,
         "recall": recall,
         "unmatched": unmatched,
-        "categories": dict(cats),
-        "extracted_refs": extracted_refs,
+        "category_counts": cats,
+        # Name-keyed view for the display helpers
+        "categories": {name: n for name, n in zip(CATEGORIES, cats) if n},
+        "extracted_refs": extracted,
     }
 
 
 # ---------------------------------------------------------------------------
 # Output helpers
+#
+# Each _fmt_* helper assembles its report block as a list of lines and
+# returns one string; main concatenates the blocks and writes stdout once
+# instead of paying a write call per line.
 # ---------------------------------------------------------------------------
 
-CATEGORIES = [
-    "no_id",
-    "doi_only",
-    "journal_no_raw",
-    "journal_with_raw",
-    "arxiv_only",
-    "zero_extract",
-]
-
-
-def print_overall_breakdown(totals: dict[str, int], grand_total_unmatched: int) -> None:
-    print("Overall unmatched category breakdown")
-    print("=" * 45)
+def _fmt_overall_breakdown(totals: dict[str, int], grand_total_unmatched: int) -> str:
+    lines = [
+        "Overall unmatched category breakdown",
+        "=" * 45,
+    ]
     for cat in CATEGORIES:
         n = totals.get(cat, 0)
         pct = 100 * n / grand_total_unmatched if grand_total_unmatched else 0
         label = cat.ljust(20)
-        print(f"  {label} {n:6d}  ({pct:5.1f}%)")
-    print(f"  {'TOTAL'.ljust(20)} {grand_total_unmatched:6d}")
-    print()
+        lines.append(f"  {label} {n:6d}  ({pct:5.1f}%)")
+    lines.append(f"  {'TOTAL'.ljust(20)} {grand_total_unmatched:6d}")
+    lines.append("")
+    return "\n".join(lines) + "\n"
 
 
-def print_per_paper(
+def _fmt_per_paper(
     paper_results: list[tuple[str, dict]],
     min_actionable: int = 5,
-) -> list[tuple[str, dict]]:
-    """Print per-paper breakdown for papers with >= min_actionable journal_with_raw misses.
-
-    Returns papers sorted by actionable count descending.
-    """
+) -> str:
+    """Format per-paper breakdown for papers with >= min_actionable journal_with_raw misses."""
     actionable = [
         (paper_id, res)
         for paper_id, res in paper_results
@@ -392,17 +553,17 @@ def print_per_paper(
     actionable.sort(key=lambda x: x[1]["categories"]["journal_with_raw"], reverse=True)
 
     if not actionable:
-        print(f"No papers with >= {min_actionable} actionable (journal_with_raw) misses.\n")
-        return actionable
-
-    print(f"Papers with >= {min_actionable} actionable misses (sorted by miss count)")
-    print("=" * 70)
-    header = f"{'Paper':<16} {'Recall':>7} {'Inspire':>8} {'Matched':>8} {'j_w_raw':>8} {'j_no_raw':>9} {'doi_only':>9} {'no_id':>7}"
-    print(header)
-    print("-" * 70)
+        return f"No papers with >= {min_actionable} actionable (journal_with_raw) misses.\n\n"
+
+    lines = [
+        f"Papers with >= {min_actionable} actionable misses (sorted by miss count)",
+        "=" * 70,
+        f"{'Paper':<16} {'Recall':>7} {'Inspire':>8} {'Matched':>8} {'j_w_raw':>8} {'j_no_raw':>9} {'doi_only':>9} {'no_id':>7}",
+        "-" * 70,
+    ]
     for paper_id, res in actionable:
         cats = res["categories"]
-        print(
+        lines.append(
             f"{paper_id:<16} "
             f"{res['recall']:>7.1%} "
             f"{res['inspire_count']:>8d} "
@@ -412,15 +573,15 @@ def print_per_paper(
             f"{cats.get('doi_only', 0):>9d} "
             f"{cats.get('no_id', 0):>7d}"
         )
-    print()
-    return actionable
+    lines.append("")
+    return "\n".join(lines) + "\n"
 
 
-def print_top_actionable_raw(
+def _fmt_top_actionable_raw(
     paper_results: list[tuple[str, dict]],
     top_n: int = 20,
-) -> None:
-    """Print raw_refs text for the top N papers by actionable miss count."""
+) -> str:
+    """Format raw_refs text for the top N papers by actionable miss count."""
     actionable = [
         (paper_id, res)
         for paper_id, res in paper_results
@@ -429,178 +590,191 @@ def print_top_actionable_raw(
     actionable.sort(key=lambda x: x[1]["categories"]["journal_with_raw"], reverse=True)
 
     if not actionable:
-        print("No actionable misses (journal_with_raw) found in any paper.\n")
-        return
+        return "No actionable misses (journal_with_raw) found in any paper.\n\n"
 
-    print(f"Raw ref text for top {top_n} actionable papers")
-    print("=" * 70)
+    lines = [
+        f"Raw ref text for top {top_n} actionable papers",
+        "=" * 70,
+    ]
     for paper_id, res in actionable[:top_n]:
-        missed = [u for u in res["unmatched"] if u["category"] == "journal_with_raw"]
-        print(f"\n--- {paper_id} (recall={res['recall']:.1%}, {len(missed)} actionable misses) ---")
+        missed = [u for u in res["unmatched"] if u["category"] == _JOURNAL_WITH_RAW]
+        lines.append("")
+        lines.append(f"--- {paper_id} (recall={res['recall']:.1%}, {len(missed)} actionable misses) ---")
         for u in missed:
             journal_raw = u.get("raw_text", "")
             inspire_jv = f"{u['journal']} vol={u['volume']}"
             arxiv_str = f" arxiv={u['arxiv']}" if u["arxiv"] else ""
             doi_str = f" doi={u['doi']}" if u["doi"] else ""
-            print(f"  INSPIRE: {inspire_jv}{arxiv_str}{doi_str}")
+            lines.append(f"  INSPIRE: {inspire_jv}{arxiv_str}{doi_str}")
             if journal_raw:
-                print(f"  raw_ref: {journal_raw}")
+                lines.append(f"  raw_ref: {journal_raw}")
             else:
-                print("  raw_ref: (none)")
-    print()
+                lines.append("  raw_ref: (none)")
+    lines.append("")
+    return "\n".join(lines) + "\n"
 
 
 # ---------------------------------------------------------------------------
 # Near-miss analysis for journal_no_raw refs
 # ---------------------------------------------------------------------------
 
-def analyze_journal_no_raw(paper_results: list[tuple[str, dict]]) -> dict:
-    """Break down journal_no_raw unmatched refs into near-miss categories.
-
-    For each journal_no_raw ref, checks extracted refs from the same paper:
-      not_extracted   - journal not found at all in extracted refs
-      near_miss_journal - same journal found, but no matching volume
-      near_miss_volume  - same journal AND volume found (normalization bug — wasn't matched)
+def _scan_journal_no_raw(paper_results: list[tuple[str, dict]]) -> list[dict]:
+    """Match every journal_no_raw unmatched ref against its paper's extracted
+    refs, once.
 
-    Returns a dict with:
-      counts: {category: int}
-      near_miss_volume_cases: list of {paper_id, inspire, extracted} for debugging
+    Both the near-miss breakdown and the volume-mismatch analysis used to
+    redo this filtering independently; they now consume the records built
+    here. Each record holds:
+      paper_id, iref, journal_matches (extracted (journal, volume, raw_ref)
+      rows with a matching journal), volume_matches (subset that also
+      matches the volume)
     """
-    counts: dict[str, int] = defaultdict(int)
-    near_miss_volume_cases: list[dict] = []
-
+    records: list[dict] = []
     for paper_id, res in paper_results:
-        extracted_refs = res.get("extracted_refs", [])
-        ext_with_journal = [r for r in extracted_refs if r["journal"]]
+        ext = res.get("extracted_refs") or {}
+        # Zip the parallel field lists into (journal, volume, raw_ref) rows once
+        ext_with_journal = [
+            row
+            for row in zip(ext.get("journal", ()), ext.get("volume", ()), ext.get("raw_ref", ()))
+            if row[0]
+        ]
+
+        # Several unmatched refs often cite the same journal; filter the
+        # extracted rows once per distinct journal within a paper
+        jm_cache: dict[str, list[tuple[str, str, str]]] = {}
 
         for iref in res["unmatched"]:
-            if iref["category"] != "journal_no_raw":
+            if iref["category"] != _JOURNAL_NO_RAW:
                 continue
 
             insp_j = iref["journal"]
             insp_v = iref["volume"]
 
-            # Check if any extracted ref has the same journal
-            journal_matches = [
-                r for r in ext_with_journal
-                if journals_match(insp_j, r["journal"])
+            journal_matches = jm_cache.get(insp_j)
+            if journal_matches is None:
+                journal_matches = jm_cache[insp_j] = [
+                    row for row in ext_with_journal
+                    if journals_match(insp_j, row[0])
+                ]
+            volume_matches = [
+                row for row in journal_matches
+                if insp_v and row[1] and volumes_match(insp_v, row[1])
             ]
+            records.append({
+                "paper_id": paper_id,
+                "iref": iref,
+                "journal_matches": journal_matches,
+                "volume_matches": volume_matches,
+            })
+    return records
 
-            if not journal_matches:
-                counts["not_extracted"] += 1
-                continue
 
-            # Journal matched — check if any also has the same volume
-            volume_matches = [
-                r for r in journal_matches
-                if insp_v and r["volume"] and volumes_match(insp_v, r["volume"])
-            ]
+def analyze_journal_no_raw(jnr_records: list[dict]) -> dict:
+    """Break down journal_no_raw unmatched refs into near-miss categories.
 
-            if volume_matches:
-                counts["near_miss_volume"] += 1
-                near_miss_volume_cases.append({
-                    "paper_id": paper_id,
-                    "inspire": iref,
-                    "extracted": volume_matches[0],
-                })
-            else:
-                counts["near_miss_journal"] += 1
+    For each journal_no_raw ref, checks extracted refs from the same paper:
+      not_extracted   - journal not found at all in extracted refs
+      near_miss_journal - same journal found, but no matching volume
+      near_miss_volume  - same journal AND volume found (normalization bug — wasn't matched)
+
+    Returns a dict with:
+      counts: {category: int}
+      near_miss_volume_cases: list of {paper_id, inspire, extracted} for debugging
+    """
+    cats: list[str] = []
+    near_miss_volume_cases: list[dict] = []
+
+    for rec in jnr_records:
+        if not rec["journal_matches"]:
+            cats.append("not_extracted")
+        elif rec["volume_matches"]:
+            cats.append("near_miss_volume")
+            near_miss_volume_cases.append({
+                "paper_id": rec["paper_id"],
+                "inspire": rec["iref"],
+                "extracted": rec["volume_matches"][0],
+            })
+        else:
+            cats.append("near_miss_journal")
 
     return {
-        "counts": dict(counts),
+        "counts": dict(Counter(cats)),
         "near_miss_volume_cases": near_miss_volume_cases,
     }
 
 
-def print_volume_mismatch_details(paper_results: list[tuple[str, dict]]) -> None:
-    """Print detailed volume mismatch analysis for near_miss_journal cases."""
+def _fmt_volume_mismatch_details(jnr_records: list[dict]) -> str:
+    """Format detailed volume mismatch analysis for near_miss_journal cases."""
     # Collect all near_miss_journal cases with their volume data
     no_extracted_vols = 0
     has_extracted_vols = 0
     letter_prefix_cases = 0
 
-    # Key: (inspire_journal, inspire_volume, tuple(sorted extracted volumes))
-    # Value: count
-    mismatch_patterns: dict[tuple, int] = defaultdict(int)
-
-    for paper_id, res in paper_results:
-        extracted_refs = res.get("extracted_refs", [])
-        ext_with_journal = [r for r in extracted_refs if r["journal"]]
-
-        for iref in res["unmatched"]:
-            if iref["category"] != "journal_no_raw":
-                continue
+    # (inspire_journal, inspire_volume, tuple(sorted extracted volumes)) keys,
+    # counted in one C-level pass at the end
+    pattern_keys: list[tuple] = []
 
-            insp_j = iref["journal"]
-            insp_v = iref["volume"]
+    for rec in jnr_records:
+        journal_matches = rec["journal_matches"]
+        # Only near_miss_journal (journal matched, volume didn't)
+        if not journal_matches or rec["volume_matches"]:
+            continue
 
-            journal_matches = [
-                r for r in ext_with_journal
-                if journals_match(insp_j, r["journal"])
-            ]
+        insp_j = rec["iref"]["journal"]
+        insp_v = rec["iref"]["volume"]
 
-            # Only process near_miss_journal (journal matched, volume didn't)
-            volume_matches = [
-                r for r in journal_matches
-                if insp_v and r["volume"] and volumes_match(insp_v, r["volume"])
-            ]
-            if volume_matches:
-                # This is near_miss_volume, not near_miss_journal — skip
-                continue
-            if not journal_matches:
-                # This is not_extracted — skip
-                continue
+        # Collect extracted volumes for this journal
+        ext_vols = sorted({v for _, v, _ in journal_matches if v})
 
-            # near_miss_journal: collect extracted volumes for this journal
-            ext_vols = sorted({r["volume"] for r in journal_matches if r["volume"]})
-
-            if not ext_vols:
-                no_extracted_vols += 1
-            else:
-                has_extracted_vols += 1
+        if not ext_vols:
+            no_extracted_vols += 1
+        else:
+            has_extracted_vols += 1
 
-            # Check if INSPIRE volume starts with a letter (section prefix like D95, A123)
-            if insp_v and insp_v[0].isalpha():
-                letter_prefix_cases += 1
+        # Check if INSPIRE volume starts with a letter (section prefix like D95, A123)
+        if insp_v and insp_v[0].isalpha():
+            letter_prefix_cases += 1
 
-            key = (insp_j, insp_v, tuple(ext_vols))
-            mismatch_patterns[key] += 1
+        pattern_keys.append((insp_j, insp_v, tuple(ext_vols)))
 
     total = no_extracted_vols + has_extracted_vols
     if total == 0:
-        return
+        return ""
 
-    print(f"Volume mismatch analysis ({total} near_miss_journal refs)")
-    print("=" * 70)
-    print(f"INSPIRE volume present, no matching extraction:")
-    print(f"  No extracted volumes for journal:   {no_extracted_vols:5d} cases")
-    print(f"  Extracted volumes exist but differ: {has_extracted_vols:5d} cases")
-    print(f"  INSPIRE volume starts with letter:  {letter_prefix_cases:5d} cases  (e.g. D95, A123, C80)")
-    print()
+    lines = [
+        f"Volume mismatch analysis ({total} near_miss_journal refs)",
+        "=" * 70,
+        f"INSPIRE volume present, no matching extraction:",
+        f"  No extracted volumes for journal:   {no_extracted_vols:5d} cases",
+        f"  Extracted volumes exist but differ: {has_extracted_vols:5d} cases",
+        f"  INSPIRE volume starts with letter:  {letter_prefix_cases:5d} cases  (e.g. D95, A123, C80)",
+        "",
+    ]
 
     # Sort by count descending, then by key for stability
-    sorted_patterns = sorted(mismatch_patterns.items(), key=lambda x: -x[1])
+    sorted_patterns = sorted(Counter(pattern_keys).items(), key=lambda x: -x[1])
 
-    print(f"Top 30 specific mismatches (inspire_journal  INSPIRE_vol -> [extracted_vols]):")
-    print("-" * 70)
+    lines.append(f"Top 30 specific mismatches (inspire_journal  INSPIRE_vol -> [extracted_vols]):")
+    lines.append("-" * 70)
     for (insp_j, insp_v, ext_vols_tuple), count in sorted_patterns[:30]:
         ext_vols_list = list(ext_vols_tuple) if ext_vols_tuple else []
         ext_display = str(ext_vols_list) if ext_vols_list else "(none)"
         insp_display = f"{insp_v!r}" if insp_v else "(empty)"
-        print(f"  {insp_j:<30s} {insp_display:<10s} -> {ext_display:<30s}  ({count} cases)")
-    print()
+        lines.append(f"  {insp_j:<30s} {insp_display:<10s} -> {ext_display:<30s}  ({count} cases)")
+    lines.append("")
+    return "\n".join(lines) + "\n"
 
 
-def print_journal_no_raw_breakdown(
-    paper_results: list[tuple[str, dict]],
+def _fmt_journal_no_raw_breakdown(
+    jnr_records: list[dict],
     grand_totals: dict[str, int],
-) -> None:
-    """Print near-miss breakdown for journal_no_raw refs."""
+) -> str:
+    """Format near-miss breakdown for journal_no_raw refs."""
     total_jnr = grand_totals.get("journal_no_raw", 0)
     if total_jnr == 0:
-        return
+        return ""
 
-    result = analyze_journal_no_raw(paper_results)
+    result = analyze_journal_no_raw(jnr_records)
     counts = result["counts"]
     cases = result["near_miss_volume_cases"]
 
@@ -612,31 +786,35 @@ def print_journal_no_raw_breakdown(
         "near_miss_volume": "same journal+volume but not matched",
     }
 
-    print(f"journal_no_raw breakdown ({total_jnr} refs)")
-    print("=" * 70)
+    lines = [
+        f"journal_no_raw breakdown ({total_jnr} refs)",
+        "=" * 70,
+    ]
     for cat in order:
         n = counts.get(cat, 0)
         pct = 100 * n / total_jnr if total_jnr else 0
         label = cat.ljust(22)
         desc = descriptions[cat]
-        print(f"  {label} {n:5d}  ({pct:5.1f}%)  -- {desc}")
-    print()
+        lines.append(f"  {label} {n:5d}  ({pct:5.1f}%)  -- {desc}")
+    lines.append("")
 
     if not cases:
-        return
+        return "\n".join(lines) + "\n"
 
-    print(f"near_miss_volume cases ({len(cases)} refs — same journal+volume, not matched)")
-    print("=" * 70)
+    lines.append(f"near_miss_volume cases ({len(cases)} refs — same journal+volume, not matched)")
+    lines.append("=" * 70)
     for c in cases:
         paper_id = c["paper_id"]
         ins = c["inspire"]
-        ext = c["extracted"]
-        print(f"\n  Paper: {paper_id}")
-        print(f"  INSPIRE  journal={ins['journal']!r:30s} volume={ins['volume']!r}")
-        print(f"  Extracted journal={ext['journal']!r:30s} volume={ext['volume']!r}")
-        if ext.get("raw_ref"):
-            print(f"  raw_ref: {ext['raw_ref'][:100]}")
-    print()
+        ext_j, ext_v, ext_raw = c["extracted"]
+        lines.append("")
+        lines.append(f"  Paper: {paper_id}")
+        lines.append(f"  INSPIRE  journal={ins['journal']!r:30s} volume={ins['volume']!r}")
+        lines.append(f"  Extracted journal={ext_j!r:30s} volume={ext_v!r}")
+        if ext_raw:
+            lines.append(f"  raw_ref: {ext_raw[:100]}")
+    lines.append("")
+    return "\n".join(lines) + "\n"
 
 
 # ---------------------------------------------------------------------------
@@ -676,6 +854,13 @@ def parse_args() -> argparse.Namespace:
         metavar="DIR",
         help="Directory containing INSPIRE metadata JSON files",
     )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        metavar="N",
+        help="Worker processes for per-paper analysis (default: CPU count)",
+    )
     p.add_argument(
         "--min-actionable",
         type=int,
@@ -693,8 +878,13 @@ def parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
+@lru_cache(maxsize=None)
 def resolve_dir(path: str) -> str:
-    """Resolve path relative to script location if not absolute."""
+    """Resolve path relative to script location if not absolute.
+
+    Cached: repeated calls with the same path skip the isdir/abspath
+    syscalls.
+    """
     if os.path.isabs(path):
         return path
     # Try relative to cwd first, then relative to repo root (script is in scripts/)
@@ -708,26 +898,43 @@ def resolve_dir(path: str) -> str:
     return os.path.abspath(path)
 
 
-def find_papers(results_dir: str, metadata_dir: str, paper_id: str | None) -> list[str]:
-    """Return list of paper IDs available in both directories."""
-    result_files = {
-        os.path.splitext(f)[0]
-        for f in os.listdir(results_dir)
-        if f.endswith(".json")
-    }
-    meta_files = {
-        os.path.splitext(f)[0]
-        for f in os.listdir(metadata_dir)
-        if f.endswith(".json")
+def _json_stems(directory: str) -> set[str]:
+    """Stems of the .json files in a directory, in one scandir pass."""
+    return {
+        e.name[:-5]
+        for e in os.scandir(directory)
+        if e.name.endswith(".json") and e.is_file()
     }
-    common = sorted(result_files & meta_files)
 
+
+def find_papers(results_dir: str, metadata_dir: str, paper_id: str | None) -> list[str]:
+    """Return list of paper IDs available in both directories."""
     if paper_id:
-        if paper_id not in common:
+        # Two stat calls beat scanning both directories
+        if not (
+            os.path.exists(os.path.join(results_dir, paper_id + ".json"))
+            and os.path.exists(os.path.join(metadata_dir, paper_id + ".json"))
+        ):
             print(f"Error: paper '{paper_id}' not found in both directories.", file=sys.stderr)
             sys.exit(1)
         return [paper_id]
-    return common
+
+    return sorted(_json_stems(results_dir) & _json_stems(metadata_dir))
+
+
+def _process_paper(paper_id: str, results_dir: str, metadata_dir: str) -> tuple[str, dict] | None:
+    """Load and analyze one paper; None when its files cannot be read."""
+    result_path = os.path.join(results_dir, paper_id + ".json")
+    meta_path = os.path.join(metadata_dir, paper_id + ".json")
+
+    try:
+        inspire_refs = load_inspire_refs(meta_path)
+        extracted_refs = load_extracted_refs(result_path)
+    except Exception as e:
+        print(f"Warning: skipping {paper_id}: {e}", file=sys.stderr)
+        return None
+
+    return paper_id, analyze_paper(inspire_refs, extracted_refs)
 
 
 def main() -> None:
@@ -739,22 +946,23 @@ def main() -> None:
     print(f"Analyzing {len(papers)} paper(s)...", file=sys.stderr)
 
     paper_results: list[tuple[str, dict]] = []
-    grand_totals: dict[str, int] = defaultdict(int)
+    grand_counts = [0] * len(CATEGORIES)
     total_inspire = 0
     total_matched = 0
 
-    for paper_id in papers:
-        result_path = os.path.join(results_dir, paper_id + ".json")
-        meta_path = os.path.join(metadata_dir, paper_id + ".json")
-
-        try:
-            inspire_refs = load_inspire_refs(meta_path)
-            extracted_refs = load_extracted_refs(result_path)
-        except Exception as e:
-            print(f"Warning: skipping {paper_id}: {e}", file=sys.stderr)
+    worker = partial(_process_paper, results_dir=results_dir, metadata_dir=metadata_dir)
+    if len(papers) >= 8 and args.jobs > 1:
+        # ex.map preserves input order, so output stays deterministic.
+        with ProcessPoolExecutor(max_workers=args.jobs) as ex:
+            outputs = list(ex.map(worker, papers, chunksize=16))
+    else:
+        # Not worth the pool startup cost for a handful of papers.
+        outputs = [worker(paper_id) for paper_id in papers]
+
+    for out in outputs:
+        if out is None:
             continue
-
-        res = analyze_paper(inspire_refs, extracted_refs)
+        paper_id, res = out
 
         # Apply recall filters
         if args.min_recall is not None and res["recall"] < args.min_recall:
@@ -765,23 +973,28 @@ def main() -> None:
         paper_results.append((paper_id, res))
         total_inspire += res["inspire_count"]
         total_matched += res["matched"]
-        for cat, count in res["categories"].items():
-            grand_totals[cat] += count
+        for i, count in enumerate(res["category_counts"]):
+            grand_counts[i] += count
 
-    grand_total_unmatched = sum(grand_totals.values())
+    grand_totals = {name: n for name, n in zip(CATEGORIES, grand_counts) if n}
+    grand_total_unmatched = sum(grand_counts)
     overall_recall = total_matched / total_inspire if total_inspire else 0.0
 
-    print(f"\nTotal papers analyzed: {len(paper_results)}")
-    print(f"Total INSPIRE refs:    {total_inspire}")
-    print(f"Total matched:         {total_matched}  ({overall_recall:.1%} recall)")
-    print(f"Total unmatched:       {grand_total_unmatched}")
-    print()
-
-    print_overall_breakdown(grand_totals, grand_total_unmatched)
-    print_journal_no_raw_breakdown(paper_results, grand_totals)
-    print_volume_mismatch_details(paper_results)
-    print_per_paper(paper_results, min_actionable=args.min_actionable)
-    print_top_actionable_raw(paper_results, top_n=args.top_raw)
+    jnr_records = _scan_journal_no_raw(paper_results)
+
+    # Assemble the whole report and write it in one go
+    parts = [
+        f"\nTotal papers analyzed: {len(paper_results)}\n"
+        f"Total INSPIRE refs:    {total_inspire}\n"
+        f"Total matched:         {total_matched}  ({overall_recall:.1%} recall)\n"
+        f"Total unmatched:       {grand_total_unmatched}\n\n",
+        _fmt_overall_breakdown(grand_totals, grand_total_unmatched),
+        _fmt_journal_no_raw_breakdown(jnr_records, grand_totals),
+        _fmt_volume_mismatch_details(jnr_records),
+        _fmt_per_paper(paper_results, min_actionable=args.min_actionable),
+        _fmt_top_actionable_raw(paper_results, top_n=args.top_raw),
+    ]
+    sys.stdout.write("".join(parts))
 
 
 if __name__ == "__main__":